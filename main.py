@@ -10,18 +10,43 @@
 
 from __future__ import annotations
 
-import glob
+import functools
+import hashlib
 import importlib.util
+import io
 import json
 import os
 import sys
+import threading
+import time
+from collections import namedtuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import datetime, timedelta, timezone
+import atexit
+from datetime import datetime, timedelta
 from typing import Any, Dict, List, Set
 import random, string
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import tkinter as tk
-from tkinter import Toplevel, messagebox
+
+try:
+    import orjson                      # optional C/SIMD JSON codec
+    _PRETTY_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+except ImportError:                    # degrade gracefully to stdlib
+    orjson = None
+    _PRETTY_OPTS = 0
+
+try:
+    import simdjson                    # optional lazy (On-Demand) parser
+except ImportError:
+    simdjson = None
+
+try:
+    import ijson                       # optional incremental JSON parser
+except ImportError:
+    ijson = None
+from tkinter import Toplevel, filedialog, messagebox
 from tkinter.scrolledtext import ScrolledText
 
 # ── constants ─────────────────────────────────────────────────────────────
@@ -30,6 +55,53 @@ CONFIG_FILE  = os.path.join(SCRIPT_DIR, "config.json")
 LOG_FILE     = os.path.join(SCRIPT_DIR, "error.log")
 BASE_URL     = "https://liveiqfranchiseeapi.subway.com"
 
+CACHE_DIR       = os.path.join(SCRIPT_DIR, ".cache")
+STORE_CACHE_TTL = 6 * 60 * 60         # seconds before discovery re-runs
+
+# one keep-alive session for the whole process: connections to the LiveIQ
+# host are reused instead of paying a TCP+TLS handshake per store request
+# transient statuses worth retrying: rate limits, server hiccups, and the
+# vendor's 529 "site overloaded"; Retry honours Retry-After on 429/503.
+# Jitter desynchronizes the 10 workers so their retries don't re-land as
+# another burst, but the knob only exists on urllib3 ≥ 2.0.
+_RETRY_KW: Dict[str, Any] = dict(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504, 529],
+)
+try:
+    _RETRY = Retry(backoff_jitter=0.5, **_RETRY_KW)
+except TypeError:
+    _RETRY = Retry(**_RETRY_KW)
+
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=_RETRY,
+))
+SESSION.headers.update({
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip",
+    "Connection": "keep-alive",
+})
+# resolve the environment once at startup instead of rescanning
+# os.environ on every call: proxy and CA-bundle overrides still apply
+# for users behind corporate gateways, only the per-request scan goes
+SESSION.proxies = requests.utils.getproxies()
+_ca_bundle = os.environ.get("REQUESTS_CA_BUNDLE") or os.environ.get("CURL_CA_BUNDLE")
+if _ca_bundle:
+    SESSION.verify = _ca_bundle
+SESSION.trust_env = False
+
+# (connect, read) — fail fast on an unreachable host, be patient on big bodies
+TIMEOUT = (3.05, 10)
+
+# one shared worker pool for every fan-out (viewer and drop-in modules):
+# threads are created once per process and the worker cap bounds total
+# in-flight API calls the way a semaphore would
+EXECUTOR = ThreadPoolExecutor(max_workers=10, thread_name_prefix="fetch")
+
 ENDPOINTS: Dict[str, str] = {
     "Sales Summary"               : "/api/SalesSummary/{restaurantNumbers}/startDate/{startDate}/endDate/{endDate}",
     "Daily Sales Summary"         : "/api/DailySalesSummary/{restaurantNumbers}/startDate/{startDate}/endDate/{endDate}",
@@ -40,12 +112,50 @@ ENDPOINTS: Dict[str, str] = {
     "Transaction Details"         : "/api/TransactionDetails/{restaurantNumbers}/startDate/{startDate}/endDate/{endDate}",
 }
 
+# every template substitutes the same three fields in the same order, so
+# split each one once at import instead of re-parsing it with str.format
+# on every fetch
+ENDPOINT_PARTS: Dict[str, tuple] = {
+    name: tuple(
+        tmpl.replace("{restaurantNumbers}", "\0")
+            .replace("{startDate}", "\0")
+            .replace("{endDate}", "\0")
+            .split("\0")
+    )
+    for name, tmpl in ENDPOINTS.items()
+}
+
+def build_url(ep: str, sid: str, start: str, end: str) -> str:
+    pre, mid1, mid2, tail = ENDPOINT_PARTS[ep]
+    return BASE_URL + pre + sid + mid1 + start + mid2 + end + tail
+
+# endpoints whose responses can run to tens of MB — worth parsing
+# incrementally instead of materialising the whole document
+STREAMING_ENDPOINTS = {"Transaction Details"}
+
+# endpoints that accept a comma-separated {restaurantNumbers} list; the
+# rest are fetched one store per request. Transaction Details is left
+# out deliberately — its bodies are big enough that we stream them per
+# store instead of batching.
+BATCHABLE_ENDPOINTS = {
+    "Sales Summary",
+    "Daily Sales Summary",
+    "Daily Timeclock",
+    "Third Party Sales Summary",
+    "Third Party Transaction Summary",
+    "Transaction Summary",
+}
+BATCH_LIMIT = 20                      # max store IDs per batched request
+
 # ── globals (populated at runtime) ────────────────────────────────────────
 all_stores:         Set[str]              = set()
 store_vars:         Dict[str, tk.IntVar]  = {}
 account_vars:       Dict[str, tk.IntVar]  = {}
 account_store_map:  Dict[str, List[str]]  = {}
 config_accounts:    List[Dict[str, Any]]  = []
+# store → (ClientID, ClientKEY, account name); first account wins when
+# configs overlap, so each store is only ever fetched with one credential
+store_owner:        Dict[str, tuple]      = {}
 
 # ── date globals (for modules) ───────────────────────────────────────────
 start_entry: tk.Entry
@@ -58,38 +168,213 @@ def get_selected_end_date() -> str:
     return end_entry.get()
 
 # ── helpers ───────────────────────────────────────────────────────────────
+def json_loads(data: bytes) -> Any:
+    """Decode JSON bytes, preferring orjson (C parser) over stdlib json."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_pretty(obj: Any) -> str:
+    """Pretty-print *obj* as indented JSON, preferring orjson."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=_PRETTY_OPTS).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+# header dicts are identical for every call an account makes; build each
+# one once instead of allocating a fresh dict per request
+_HEADER_CACHE: Dict[str, Dict[str, str]] = {}
+
+def api_headers(cid: str, ckey: str) -> Dict[str, str]:
+    hdr = _HEADER_CACHE.get(cid)
+    if hdr is None:
+        hdr = _HEADER_CACHE[cid] = {
+            "api-client": cid,
+            "api-key": ckey,
+            "Accept": "application/json",
+        }
+    return hdr
+
+# open the log once, line-buffered, instead of paying open+close
+# syscalls for every message when parallel fetches fail in bursts
+_LOG_FH = open(LOG_FILE, "a", encoding="utf-8", buffering=1)
+atexit.register(_LOG_FH.close)
+
 def log_error(msg: str) -> None:
-    ts = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
-    with open(LOG_FILE, "a", encoding="utf-8") as fh:
-        fh.write(f"[{ts}] {msg}\n")
+    ts = time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime())
+    _LOG_FH.write(f"[{ts}] {msg}\n")
 
-def fetch_data(ep: str, sid: str, start: str, end: str,
-               cid: str, ckey: str) -> Any:
-    path = ENDPOINTS[ep].format(restaurantNumbers=sid, startDate=start, endDate=end)
+# result wrapper: `ok` flags success so consumers never have to probe the
+# payload for an "error" key that a real API field could collide with
+FetchResult = namedtuple("FetchResult", "ok data")
+
+def fetch_url(url: str, cid: str, ckey: str) -> FetchResult:
+    """GET a prebuilt endpoint URL — the whole worker-thread hot path."""
     try:
-        r = requests.get(
-            BASE_URL + path,
-            headers={"api-client": cid, "api-key": ckey, "Accept": "application/json"},
-            timeout=10,
-        )
+        # the API never redirects; skipping redirect resolution keeps the
+        # call one straight pool round-trip
+        r = SESSION.get(url, headers=api_headers(cid, ckey),
+                        timeout=TIMEOUT, allow_redirects=False)
         r.raise_for_status()
-        return r.json()
+        return FetchResult(True, json_loads(r.content))
     except Exception as exc:                       # noqa: BLE001
-        log_error(f"Fetch error {sid} {ep}: {exc}")
-        return {"error": str(exc)}
+        log_error(f"Fetch error {url}: {exc}")
+        return FetchResult(False, str(exc))
+
+def fetch_data(ep: str, sid: str, start: str, end: str,
+               cid: str, ckey: str) -> FetchResult:
+    """Convenience wrapper kept for the drop-in modules."""
+    return fetch_url(build_url(ep, sid, start, end), cid, ckey)
+
+class _SniffedStream:
+    """Replay sniffed head bytes in front of a response stream."""
+
+    __slots__ = ("_head", "_raw")
+
+    def __init__(self, head: bytes, raw: Any) -> None:
+        self._head = head
+        self._raw  = raw
+
+    def read(self, size: int = -1) -> bytes:
+        if size == 0:
+            # ijson's bytes/str probe — must not consume the head
+            return b""
+        chunk = self._raw.read(size)
+        if self._head:
+            chunk, self._head = self._head + chunk, b""
+        return chunk
+
+def fetch_stream(ep: str, sid: str, start: str, end: str,
+                 cid: str, ckey: str):
+    """Yield response records one at a time via ijson.
+
+    Overlaps download, parse, and rendering so the first record shows
+    up after one round trip instead of after the full payload has been
+    decoded. Requires the optional ijson package.
+    """
+    if ijson is None:
+        raise RuntimeError("fetch_stream requires the optional ijson package")
+    r = SESSION.get(
+        build_url(ep, sid, start, end),
+        headers=api_headers(cid, ckey),
+        timeout=TIMEOUT,
+        stream=True,
+    )
+    try:
+        r.raise_for_status()
+        # requests leaves r.raw as the wire bytes — have urllib3 gunzip
+        # inline so ijson sees JSON instead of the gzip magic
+        r.raw.decode_content = True
+        # bare array vs {"data": [...]} wrapper — sniff past any leading
+        # whitespace, then splice the consumed bytes back onto the stream
+        head = r.raw.read(1)
+        while head and head[-1:] in b" \t\r\n":
+            head += r.raw.read(1)
+        prefix = "item" if head[-1:] == b"[" else "data.item"
+        yield from ijson.items(_SniffedStream(head, r.raw), prefix)
+    finally:
+        r.close()
+
+def split_batch(res: Any, ids: List[str]) -> Dict[str, Any]:
+    """Re-associate rows of a multi-store response to their stores.
+
+    Falls back to a single combined block if any row cannot be matched
+    by its restaurantNumber field, so nothing is silently dropped.
+    """
+    payload = res.get("data", res) if isinstance(res, dict) else res
+    rows = payload if isinstance(payload, list) else [payload]
+    by_store: Dict[str, List[Any]] = {sid: [] for sid in ids}
+    for row in rows:
+        sid = str(row.get("restaurantNumber", "")) if isinstance(row, dict) else ""
+        if sid not in by_store:
+            return {",".join(ids): payload}
+        by_store[sid].append(row)
+    return by_store
 
 def flatten_json(obj: Any, parent: str = "", sep: str = ".") -> Dict[str, Any]:
+    # iterative walk writing straight into one dict — the old recursive
+    # version allocated and merged a fresh dict at every nested node
     out: Dict[str, Any] = {}
-    if isinstance(obj, dict):
-        for k, v in obj.items():
-            out.update(flatten_json(v, f"{parent}{sep}{k}" if parent else k, sep))
-    elif isinstance(obj, list):
-        for i, v in enumerate(obj):
-            out.update(flatten_json(v, f"{parent}[{i}]", sep))
-    else:
-        out[parent] = obj
+    stack = [(obj, parent)]
+    pop, push = stack.pop, stack.append     # bind hot methods once
+    _dict, _list = dict, list
+    while stack:
+        node, path = pop()
+        if isinstance(node, _dict):
+            for k, v in reversed(node.items()):
+                push((v, f"{path}{sep}{k}" if path else k))
+        elif isinstance(node, _list):
+            for i in range(len(node) - 1, -1, -1):
+                push((node[i], f"{path}[{i}]"))
+        else:
+            out[path] = node
     return out
 
+# ── store-discovery cache ────────────────────────────────────────────────
+def discover_stores(acct: Dict[str, Any]):
+    """Fetch /api/Restaurants for one account; returns (acct, stores, exc)."""
+    try:
+        res = SESSION.get(
+            BASE_URL + "/api/Restaurants",
+            headers=api_headers(acct["ClientID"], acct["ClientKEY"]),
+            timeout=TIMEOUT,
+        )
+        res.raise_for_status()
+        if simdjson is not None:
+            # restaurantNumber is the only field we read, so a lazy
+            # parse skips materialising the rest of each record
+            stores = []
+            for r in simdjson.Parser().parse(res.content):
+                try:
+                    stores.append(r["restaurantNumber"])
+                except (KeyError, TypeError):
+                    pass
+        else:
+            stores = [
+                r["restaurantNumber"]
+                for r in json_loads(res.content)
+                if "restaurantNumber" in r
+            ]
+        return acct, stores, None
+    except Exception as exc:              # noqa: BLE001
+        return acct, None, exc
+
+def _store_cache_path(cid: str) -> str:
+    # hash the ClientID so credentials never appear in a file name
+    return os.path.join(CACHE_DIR, hashlib.sha1(cid.encode()).hexdigest() + ".json")
+
+def _read_cached_stores(cid: str):
+    """Return the cached store list for *cid*, or None if missing/stale.
+
+    An entry is stale once it exceeds STORE_CACHE_TTL or whenever
+    config.json has been edited after it was written — changed
+    credentials must force a real discovery.
+    """
+    path = _store_cache_path(cid)
+    try:
+        st = os.stat(path)
+        if time.time() - st.st_mtime >= STORE_CACHE_TTL:
+            return None
+        if os.stat(CONFIG_FILE).st_mtime > st.st_mtime:
+            return None
+        with open(path, "rb") as fh:
+            return json_loads(fh.read()).get("stores", [])
+    except Exception:                     # missing or corrupt entry
+        return None
+
+def _write_cached_stores(cid: str, stores: List[str]) -> None:
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(_store_cache_path(cid), "w", encoding="utf-8") as fh:
+            json.dump({"stores": stores, "fetched": time.time()}, fh)
+    except OSError as exc:
+        log_error(f"Store cache write failed: {exc}")
+
+def _revalidate_store_cache(accounts: List[Dict[str, Any]]) -> None:
+    """Refresh cache entries served from disk so the next launch is current."""
+    for acct, stores, exc in EXECUTOR.map(discover_stores, accounts):
+        if exc is None:
+            _write_cached_stores(acct["ClientID"], stores)
+
 # ── config bootstrap ──────────────────────────────────────────────────────
 def load_config_and_stores() -> None:
     """
@@ -135,194 +420,458 @@ def load_config_and_stores() -> None:
         raise SystemExit
 
     # ── 2) load and validate ─────────────────────────────────────────────
-    with open(CONFIG_FILE, "r", encoding="utf-8") as fh:
-        cfg = json.load(fh)
+    with open(CONFIG_FILE, "rb") as fh:
+        cfg = json_loads(fh.read())
 
+    valid_accounts: List[Dict[str, Any]] = []
     for acct in cfg.get("accounts", []):
         if not all(k in acct for k in ("Name", "ClientID", "ClientKEY")):
             log_error(f"Malformed account entry: {acct}")
             continue
-
         acct["Status"] = "ERROR"          # pessimistic default
+        valid_accounts.append(acct)
 
-        # ── 3) fetch store list for this account ─────────────────────────
-        try:
-            res = requests.get(
-                BASE_URL + "/api/Restaurants",
-                headers={
-                    "api-client": acct["ClientID"],
-                    "api-key": acct["ClientKEY"],
-                    "Accept": "application/json",
-                },
-                timeout=10,
-            )
-            res.raise_for_status()
-            stores = [
-                r["restaurantNumber"]
-                for r in res.json()
-                if "restaurantNumber" in r
-            ]
-            acct["StoreIDs"] = stores
-            acct["Status"]   = "OK" if stores else "EMPTY"
-            account_store_map[acct["Name"]] = stores
-            all_stores.update(stores)
-        except Exception as exc:          # noqa: BLE001
-            log_error(f"{acct['Name']} store fetch failed: {exc}")
+    # ── 3) resolve store lists: disk cache first, then the network ──────
+    def _adopt(acct: Dict[str, Any], stores: List[str]) -> None:
+        acct["StoreIDs"] = stores
+        acct["Status"]   = "OK" if stores else "EMPTY"
+        account_store_map[acct["Name"]] = stores
+        all_stores.update(stores)
+        owner = (acct["ClientID"], acct["ClientKEY"], acct["Name"])
+        for sid in stores:
+            store_owner.setdefault(sid, owner)
+
+    from_cache: List[Dict[str, Any]] = []
+    to_fetch:   List[Dict[str, Any]] = []
+    for acct in valid_accounts:
+        stores = _read_cached_stores(acct["ClientID"])
+        if stores is not None:
+            _adopt(acct, stores)
+            from_cache.append(acct)
+        else:
+            to_fetch.append(acct)
+
+    if to_fetch:
+        with ThreadPoolExecutor(max_workers=min(16, len(to_fetch))) as ex:
+            # mutate shared state here on the caller's thread only
+            for acct, stores, exc in ex.map(discover_stores, to_fetch):
+                if exc is not None:
+                    log_error(f"{acct['Name']} store fetch failed: {exc}")
+                    continue
+                _adopt(acct, stores)
+                _write_cached_stores(acct["ClientID"], stores)
+
+    # cache hits skipped the network entirely; refresh them in the
+    # background so a stale store list self-corrects by next launch
+    if from_cache:
+        threading.Thread(
+            target=_revalidate_store_cache, args=(from_cache,), daemon=True
+        ).start()
 
     # ── 4) expose full list to rest of program ───────────────────────────
     config_accounts[:] = cfg.get("accounts", [])
 
 
 # ── external-module loader ────────────────────────────────────────────────
+_MOD_CACHE: Dict[str, Any] = {}
+
+def _run_module(name: str, path: str, root: tk.Tk) -> None:
+    """Import *name* on first use (cached thereafter) and call its run()."""
+    mod = _MOD_CACHE.get(name)
+    if mod is None:
+        try:
+            spec = importlib.util.spec_from_file_location(name, path)
+            mod  = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(mod)
+        except Exception as exc:                   # noqa: BLE001
+            log_error(f"Module {name} failed to load: {exc}")
+            return
+        if not callable(getattr(mod, "run", None)):
+            log_error(f"Module {name} has no run(window) entry point")
+            return
+        _MOD_CACHE[name] = mod
+
+    win = Toplevel(root)
+    win.title(name.capitalize()); win.geometry("800x600")
+    try:
+        mod.run(win)
+    except Exception as exc:                       # noqa: BLE001
+        log_error(f"Module {name} crashed: {exc}")
+
 def load_external_modules(root: tk.Tk) -> None:
     mod_dir = os.path.join(SCRIPT_DIR, "modules")
     if not os.path.isdir(mod_dir):
         os.makedirs(mod_dir, exist_ok=True)
         return
 
+    # startup only scans the directory; the spec/exec_module round trip
+    # is deferred to the first click on each button
+    entries = sorted(
+        (os.path.splitext(e.name)[0], e.path)
+        for e in os.scandir(mod_dir)
+        if e.name.endswith(".py") and e.is_file()
+    )
+    if not entries:
+        return
+
     frame = tk.Frame(root)
     frame.grid(row=7, column=0, pady=(10,0), sticky="n")
     row = col = 0
-    for path in glob.glob(os.path.join(mod_dir, "*.py")):
-        name = os.path.splitext(os.path.basename(path))[0]
-        def _cb(p=path, n=name):
-            def _():
-                win = Toplevel(root)
-                win.title(n.capitalize()); win.geometry("800x600")
-                # … same module-loading …
-            return _
-        tk.Button(frame, text=name.capitalize(), command=_cb(),
+    for name, path in entries:
+        tk.Button(frame, text=name.capitalize(),
+                  command=functools.partial(_run_module, name, path, root),
                   font=("Arial", 12), bg="#007ACC", fg="white")\
           .grid(row=row, column=col, padx=8, pady=5)
         col = (col+1)%4
         if col==0: row+=1
 
 # ── viewer window ─────────────────────────────────────────────────────────
+class TextBuffer:
+    """Debounced ScrolledText writer.
+
+    Appends are collected in a list and flushed as one insert every
+    *delay_ms*, collapsing thousands of Tcl round-trips (each of which
+    triggers scroll/layout work) into a handful. Everything written is
+    mirrored into *transcript*. Tk-thread only.
+    """
+
+    def __init__(self, widget, transcript, delay_ms: int = 50):
+        self.widget     = widget
+        self.transcript = transcript
+        self.delay_ms   = delay_ms
+        self._buf: List[str] = []
+        self._pending = False
+
+    def write(self, text: str) -> None:
+        self._buf.append(text)
+        if not self._pending:
+            self._pending = True
+            try:
+                self.widget.after(self.delay_ms, self.flush)
+            except tk.TclError:                    # widget destroyed
+                self._pending = False
+
+    def flush(self) -> None:
+        self._pending = False
+        if not self._buf:
+            return
+        block = "".join(self._buf)
+        self._buf.clear()
+        self.transcript.write(block)
+        try:
+            self.widget.insert("end", block)
+            self.widget.see("end")
+        except tk.TclError:                        # widget destroyed
+            pass
+
 def open_view_window(endpoint: str, stores: List[str],
                      start: str, end: str) -> None:
     win = Toplevel(); win.title(f"View – {endpoint}"); win.geometry("800x600")
 
     toolbar = tk.Frame(win); toolbar.pack(fill="x", pady=4)
     flat_var = tk.IntVar(value=0)
-    tk.Checkbutton(toolbar, text="Flatten", variable=flat_var).pack(side="left", padx=6)
+    # plain mirror of flat_var: workers format off the Tk thread and must
+    # not touch Tcl variables, so the checkbox keeps this int in sync
+    flat_state = [0]
+    tk.Checkbutton(toolbar, text="Flatten", variable=flat_var,
+                   command=lambda: flat_state.__setitem__(0, flat_var.get()))\
+      .pack(side="left", padx=6)
     copy_btn = tk.Button(toolbar, text="Copy All", state=tk.DISABLED); copy_btn.pack(side="right", padx=6)
+    save_btn = tk.Button(toolbar, text="Save…",    state=tk.DISABLED); save_btn.pack(side="right", padx=6)
 
     txt = ScrolledText(win, wrap="word", font=("Consolas", 10))
     txt.pack(expand=True, fill="both", padx=10, pady=10)
 
+    # authoritative transcript: Copy All / Save read this instead of
+    # pulling a second full copy back out of the Tk text widget
+    transcript = io.StringIO()
+    out = TextBuffer(txt, transcript)
+
+    # closing the window mid-fetch flips this so queued callbacks no-op
+    # and the worker threads stop fanning out instead of downloading on
+    cancelled = threading.Event()
+
+    def _on_close() -> None:
+        cancelled.set()
+        win.destroy()
+
+    win.protocol("WM_DELETE_WINDOW", _on_close)
+
     def write(l=""):
-        txt.insert("end", l + "\n"); txt.see("end")
+        out.write(l + "\n")
 
     write(f"Endpoint: {endpoint}")
     write(f"Range   : {start} → {end}")
     write(f"Stores  : {', '.join(stores)}\n")
 
-    futures: Dict[Any, Any] = {}
-    with ThreadPoolExecutor(max_workers=10) as ex:
-        fetched = set()
-        for acct in config_accounts:
-            cid, ckey, aname = acct["ClientID"], acct["ClientKEY"], acct["Name"]
-            for sid in acct.get("StoreIDs", []):
-                if sid in stores and sid not in fetched:
-                    fut = ex.submit(fetch_data, endpoint, sid, start, end, cid, ckey)
-                    futures[fut] = (aname, sid); fetched.add(sid)
-
-        for fut in as_completed(futures):
-            aname, sid = futures[fut]; res = fut.result()
-            write(f"\n### {aname} – Store {sid} ###")
-            if "error" in res:
-                write(f"ERROR: {res['error']}"); continue
-
-            payload = res.get("data", res)
-            if flat_var.get():
+    def format_result(aname: str, sid: str, res: Any, flat: int) -> str:
+        # build the whole store section as one string on the worker side;
+        # the Tk thread only ever sees the finished block
+        buf = [f"\n### {aname} – Store {sid} ###"]
+        if isinstance(res, FetchResult) and not res.ok:
+            buf.append(f"ERROR: {res.data}")
+        else:
+            payload = res.data if isinstance(res, FetchResult) else res
+            if isinstance(payload, dict):
+                payload = payload.get("data", payload)
+            if flat:
                 iterable = payload if isinstance(payload, list) else [payload]
                 for idx, entry in enumerate(iterable, 1):
-                    write(f"— Entry {idx} —")
-                    for k, v in flatten_json(entry).items():
-                        write(f"{k:40} : {v}")
+                    buf.append(f"— Entry {idx} —")
+                    buf.extend(f"{k:40} : {v}"
+                               for k, v in flatten_json(entry).items())
             else:
-                write(json.dumps(payload, indent=2, ensure_ascii=False))
+                buf.append(json_pretty(payload))
+        return "\n".join(buf) + "\n"
+
+    def format_records(records: List[Any], start_idx: int, flat: int) -> str:
+        """Format one chunk of streamed records (worker side)."""
+        buf = []
+        if flat:
+            for idx, entry in enumerate(records, start_idx):
+                buf.append(f"— Entry {idx} —")
+                buf.extend(f"{k:40} : {v}"
+                           for k, v in flatten_json(entry).items())
+        else:
+            for entry in records:
+                buf.append(json_pretty(entry))
+        return "\n".join(buf) + "\n"
+
+    def marshal(fn, *args) -> None:
+        """Hand *fn* to the Tk thread; ignore a window closed mid-fetch.
+
+        Queued `after` callbacks outlive a destroyed Toplevel, so the
+        callback itself re-checks the window instead of trusting the
+        scheduling guard alone.
+        """
+        def _safe() -> None:
+            if cancelled.is_set():
+                return
+            try:
+                fn(*args)
+            except tk.TclError:
+                pass
+        try:
+            win.after(0, _safe)
+        except (tk.TclError, RuntimeError):
+            pass
 
     def copy_all() -> None:
-        win.clipboard_clear(); win.clipboard_append(txt.get("1.0", "end-1c"))
-    copy_btn.config(state=tk.NORMAL, command=copy_all)
+        out.flush()
+        win.clipboard_clear(); win.clipboard_append(transcript.getvalue())
+
+    def save_all() -> None:
+        out.flush()
+        fn = filedialog.asksaveasfilename(
+            parent=win, defaultextension=".txt",
+            filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
+        )
+        if fn:
+            with open(fn, "w", encoding="utf-8") as fh:
+                fh.write(transcript.getvalue())
+
+    def fetch_all() -> None:
+        # runs on a worker thread so the Tk mainloop keeps pumping while
+        # the store fan-out is in flight
+        # single pass over the selected stores — store_owner already maps
+        # each store to its (deduplicated) credentials
+        by_owner: Dict[tuple, List[str]] = {}
+        for sid in stores:
+            owner = store_owner.get(sid)
+            if owner is not None:
+                by_owner.setdefault(owner, []).append(sid)
+
+        def stream_store(aname: str, sid: str, cid: str, ckey: str) -> None:
+            """Stream one store's records, buffering the section worker-side.
+
+            Concurrent streams share one text buffer, so chunks marshalled
+            as they arrive would interleave across stores; the section is
+            accumulated here and handed to the UI whole on completion.
+            """
+            count = 0
+            batch: List[Any] = []
+            section = [f"\n### {aname} – Store {sid} ###\n"]
+            flat = flat_state[0]
+            try:
+                for rec in fetch_stream(endpoint, sid, start, end, cid, ckey):
+                    if cancelled.is_set():
+                        return
+                    count += 1
+                    batch.append(rec)
+                    if len(batch) >= 25:
+                        section.append(format_records(
+                            batch, count - len(batch) + 1, flat))
+                        batch = []
+                if batch:
+                    section.append(format_records(
+                        batch, count - len(batch) + 1, flat))
+                if count == 0:
+                    section.append("— No records —\n")
+            except Exception as exc:               # noqa: BLE001
+                log_error(f"Stream error {sid} {endpoint}: {exc}")
+                section.append(f"ERROR: {exc}\n")
+            marshal(out.write, "".join(section))
+
+        # huge endpoints stream record-by-record when ijson is present;
+        # batching whole accounts would defeat the constant-memory goal
+        if ijson is not None and endpoint in STREAMING_ENDPOINTS:
+            futs = [EXECUTOR.submit(stream_store, aname, sid, cid, ckey)
+                    for (cid, ckey, aname), ids in by_owner.items()
+                    for sid in ids]
+            for fut in as_completed(futs):
+                fut.result()
+            marshal(copy_btn.config, {"state": tk.NORMAL, "command": copy_all})
+            marshal(save_btn.config, {"state": tk.NORMAL, "command": save_all})
+            return
+
+        # one batched request per account — the endpoints accept a
+        # comma-separated {restaurantNumbers} list
+        futures: Dict[Any, Any] = {}
+        for (cid, ckey, aname), ids in by_owner.items():
+            if endpoint in BATCHABLE_ENDPOINTS:
+                batches = [ids[i:i+BATCH_LIMIT]
+                           for i in range(0, len(ids), BATCH_LIMIT)]
+            else:
+                batches = [[sid] for sid in ids]
+            for batch in batches:
+                # build the URL at submit time so workers do nothing but
+                # the session GET and decode
+                url = build_url(endpoint, ",".join(batch), start, end)
+                futures[EXECUTOR.submit(fetch_url, url, cid, ckey)] = (aname, batch, cid, ckey)
+
+        for fut in as_completed(futures):
+            if cancelled.is_set():
+                break
+            aname, ids, cid, ckey = futures[fut]
+            res  = fut.result()
+            flat = flat_state[0]
+            if len(ids) == 1:
+                marshal(out.write, format_result(aname, ids[0], res, flat))
+            elif not res.ok:
+                # batch rejected (e.g. size cap) — retry per store
+                for sid in ids:
+                    if cancelled.is_set():
+                        break
+                    marshal(out.write, format_result(
+                        aname, sid,
+                        fetch_url(build_url(endpoint, sid, start, end),
+                                  cid, ckey),
+                        flat))
+            else:
+                for sid, rows in split_batch(res.data, ids).items():
+                    marshal(out.write, format_result(aname, sid, rows, flat))
+        marshal(copy_btn.config, {"state": tk.NORMAL, "command": copy_all})
+        marshal(save_btn.config, {"state": tk.NORMAL, "command": save_all})
+
+    threading.Thread(target=fetch_all, daemon=True).start()
 
 # ── date-range helper ─────────────────────────────────────────────────────
+# resolvers built once at import; "Past N Days" is parsed here instead of
+# re-splitting the option string on every radio-button click
+DATE_RANGES: Dict[str, Any] = {
+    "Today":     lambda t: (t, t),
+    "Yesterday": lambda t: (t - timedelta(days=1), t - timedelta(days=1)),
+}
+for _n in (2, 3, 7, 14, 30):
+    DATE_RANGES[f"Past {_n} Days"] = (
+        lambda n: lambda t: (t - timedelta(days=n), t - timedelta(days=1))
+    )(_n)
+
 def update_dates(option: str, start_e: tk.Entry, end_e: tk.Entry) -> None:
-    today = datetime.now().date()
-    if option == "Custom":
-        return
-    if option == "Today":
-        start = end = today
-    elif option == "Yesterday":
-        start = end = today - timedelta(days=1)
-    elif option.startswith("Past"):
-        days  = int(option.split()[1])
-        end   = today - timedelta(days=1)
-        start = end - timedelta(days=days - 1)
-    else:
+    fn = DATE_RANGES.get(option)
+    if fn is None:                        # "Custom" (or unknown) — no-op
         return
+    start, end = fn(datetime.now().date())
     for e, val in ((start_e, start), (end_e, end)):
         e.delete(0, "end"); e.insert(0, str(val))
 
 
 
 class ToolTip:
+    """Lightweight tooltips backed by one shared registry.
+
+    Registering a widget just records its text in a class-level dict;
+    a single root-level <Motion> binding resolves the hovered widget
+    with winfo_containing and drives show/hide for every tooltip, so
+    each widget no longer carries four event bindings of its own.
+    """
+
+    _tips: Dict[tk.Widget, str] = {}
+    _delay   = 500
+    _after   = None
+    _tw      = None
+    _current = None
+    _bound   = False
+    _x = _y  = 0
+
     def __init__(self, widget, text, delay=500):
-        self.widget = widget
-        self.text   = text
-        self.delay  = delay
-        self.id     = None
-        self.tw     = None
-        self.x = self.y = 0
-
-        # use add='+' so these don't clobber other <Enter>/<Leave> bindings
-        widget.bind("<Enter>",       self._on_enter,  add='+')
-        widget.bind("<Leave>",       self._on_leave,  add='+')
-        widget.bind("<Motion>",      self._on_motion, add='+')
-        widget.bind("<ButtonPress>", self._on_leave,  add='+')
-
-    def _on_enter(self, event=None):
-        self._schedule()
-
-    def _on_motion(self, event):
-        # track where the cursor is
-        self.x, self.y = event.x_root, event.y_root
-
-    def _on_leave(self, event=None):
-        self._unschedule()
-
-    def _schedule(self):
-        self._unschedule()
-        self.id = self.widget.after(self.delay, self._show)
-
-    def _unschedule(self):
-        if self.id:
-            self.widget.after_cancel(self.id)
-            self.id = None
-        self._hide_tip()
-
-    def _show(self):
-        if self.tw:
+        ToolTip._tips[widget] = text
+        ToolTip._delay = delay
+        widget.bind("<Destroy>",
+                    lambda e, w=widget: ToolTip._tips.pop(w, None), add='+')
+        if not ToolTip._bound:
+            ToolTip._bound = True
+            top = widget.winfo_toplevel()
+            top.bind_all("<Motion>",      ToolTip._on_motion,       add='+')
+            top.bind_all("<Leave>",       ToolTip._on_leave,        add='+')
+            top.bind_all("<ButtonPress>", lambda e: ToolTip._cancel(), add='+')
+
+    @staticmethod
+    def _on_motion(event):
+        ToolTip._x, ToolTip._y = event.x_root, event.y_root
+        try:
+            hovered = event.widget.winfo_containing(event.x_root, event.y_root)
+        except (AttributeError, tk.TclError):
+            hovered = None
+        if hovered is ToolTip._current:
+            return
+        ToolTip._cancel()
+        ToolTip._current = hovered
+        if hovered in ToolTip._tips:
+            ToolTip._after = hovered.after(ToolTip._delay, ToolTip._show)
+
+    @staticmethod
+    def _on_leave(event):
+        # only kill the tip when the pointer actually leaves the app;
+        # crossing between child widgets also fires <Leave>
+        try:
+            hovered = event.widget.winfo_containing(event.x_root, event.y_root)
+        except (AttributeError, tk.TclError):
+            hovered = None
+        if hovered is None:
+            ToolTip._cancel()
+            ToolTip._current = None
+
+    @staticmethod
+    def _cancel():
+        if ToolTip._after:
+            try:
+                ToolTip._current.after_cancel(ToolTip._after)
+            except tk.TclError:
+                pass
+            ToolTip._after = None
+        if ToolTip._tw:
+            ToolTip._tw.destroy()
+            ToolTip._tw = None
+
+    @staticmethod
+    def _show():
+        ToolTip._after = None
+        widget = ToolTip._current
+        text   = ToolTip._tips.get(widget)
+        if text is None or ToolTip._tw:
             return
         # position it just below/right of the cursor
-        x = self.x + 10
-        y = self.y + 10
-        self.tw = tk.Toplevel(self.widget)
-        self.tw.wm_overrideredirect(True)
-        self.tw.wm_geometry(f"+{x}+{y}")
+        tw = ToolTip._tw = tk.Toplevel(widget)
+        tw.wm_overrideredirect(True)
+        tw.wm_geometry(f"+{ToolTip._x + 10}+{ToolTip._y + 10}")
         label = tk.Label(
-            self.tw, text=self.text, justify="left",
+            tw, text=text, justify="left",
             background="#ffffe0", relief="solid", borderwidth=1,
             font=("Arial", "10", "normal")
         )
         label.pack(ipadx=4, ipady=2)
 
-    def _hide_tip(self):
-        if self.tw:
-            self.tw.destroy()
-            self.tw = None
-
 
 class ScrollableFrame(tk.Frame):
     def __init__(self, parent, height=200, **kwargs):
@@ -352,11 +901,66 @@ class ScrollableFrame(tk.Frame):
             widget.bind("<Enter>",    self._bind_mousewheel,   add='+')
             widget.bind("<Leave>",    self._unbind_mousewheel, add='+')
 
+        # virtualization state (see populate())
+        self._row_factory = None
+        self._row_count   = 0
+        self._row_height  = 0
+        self._visible     = {}
+
+    # ── virtualized rows ────────────────────────────────────────
+    def populate(self, row_count, row_factory, row_height=28):
+        """Render rows lazily: only the visible band has live widgets.
+
+        *row_factory(parent, index)* returns a frame for one row. Rows
+        are created as they scroll into view and destroyed when they
+        leave it, so startup cost is O(visible) instead of O(rows).
+        """
+        self._row_count   = row_count
+        self._row_factory = row_factory
+        self._row_height  = row_height
+        total = row_count * row_height
+        self.inner.configure(height=total)
+        self.canvas.configure(scrollregion=(0, 0, 0, total),
+                              yscrollcommand=self._on_vscroll)
+        self.canvas.bind("<Configure>",
+                         lambda e: self._render_band(), add='+')
+        self._render_band()
+
+    def _on_vscroll(self, first, last):
+        self.vsb.set(first, last)
+        self._render_band()
+
+    def _render_band(self):
+        if self._row_factory is None:
+            return
+        top = self.canvas.canvasy(0)
+        h   = self.canvas.winfo_height()
+        if h <= 1:                      # not mapped yet — use configured height
+            h = int(self.canvas["height"])
+        first = max(0, int(top // self._row_height) - 1)
+        last  = min(self._row_count - 1,
+                    int((top + h) // self._row_height) + 1)
+
+        for idx in list(self._visible):
+            if idx < first or idx > last:
+                self._visible.pop(idx).destroy()
+        for idx in range(first, last + 1):
+            if idx not in self._visible:
+                row = self._row_factory(self.inner, idx)
+                row.place(x=0, y=idx * self._row_height,
+                          relwidth=1.0, height=self._row_height)
+                for w in (row, *row.winfo_children()):
+                    w.bind("<Enter>", self._bind_mousewheel,   add='+')
+                    w.bind("<Leave>", self._unbind_mousewheel, add='+')
+                self._visible[idx] = row
+
     def _on_canvas_configure(self, event):
         # force the inner window item to exactly canvas width
         self.canvas.itemconfigure(self._inner_id, width=event.width)
 
     def _on_inner_configure(self, event):
+        if self._row_factory is not None:
+            return                      # virtualized: scrollregion is fixed
         # update scrollregion to match new inner size
         self.canvas.configure(scrollregion=self.canvas.bbox("all"))
         # bind children for mousewheel...
@@ -395,6 +999,9 @@ class ScrollableFrame(tk.Frame):
         self.canvas.yview_scroll(move, "units")
 
 
+# alphabet for fake credentials — built once, not per account
+_DEBUG_KEY_ALPHABET = string.ascii_uppercase + string.digits
+
 def debug_generate_data(
     master: tk.Misc,
     num_accounts: int = 10,
@@ -412,11 +1019,12 @@ def debug_generate_data(
     config_accounts.clear()
     account_store_map.clear()
     all_stores.clear()
+    store_owner.clear()
 
     for ai in range(1, num_accounts + 1):
         name = f"Acct_{ai}"
-        cid  = ''.join(random.choices(string.ascii_uppercase + string.digits, k=8))
-        ckey = ''.join(random.choices(string.ascii_uppercase + string.digits, k=12))
+        cid  = ''.join(random.choices(_DEBUG_KEY_ALPHABET, k=8))
+        ckey = ''.join(random.choices(_DEBUG_KEY_ALPHABET, k=12))
 
         # decide if this account "fails"
         if random.random() < failure_rate:
@@ -424,12 +1032,10 @@ def debug_generate_data(
             stores = []
         else:
             status = "OK"
-            # generate unique store IDs
-            stores = {
-                str(random.randint(10**(store_id_digits-1),
-                                  10**store_id_digits-1))
-                for _ in range(stores_per_account)
-            }
+            # sample unique store IDs in O(k) — the old set comprehension
+            # silently dropped random.randint collisions
+            lo, hi = 10 ** (store_id_digits - 1), 10 ** store_id_digits
+            stores = [str(x) for x in random.sample(range(lo, hi), stores_per_account)]
 
         config_accounts.append({
             "Name":       name,
@@ -440,6 +1046,8 @@ def debug_generate_data(
         })
         account_store_map[name] = list(stores)
         all_stores.update(stores)
+        for sid in stores:
+            store_owner.setdefault(sid, (cid, ckey, name))
 
     # now initialize the IntVars _with_ a master, disabling errors
     for acct in config_accounts:
@@ -461,11 +1069,15 @@ def build_gui() -> None:
     root.title("Subway-LiveIQ-Tool")
     root.geometry("800x600")
     root.resizable(False, False)
+    # keep the window unmapped while the widget tree is built; every
+    # .grid() call on a visible window triggers a geometry reflow
+    root.withdraw()
 
     # ── DEBUG SEED ─────────────────────────────────────────────────
     DEBUG = False
     if DEBUG:
         debug_generate_data(root, num_accounts=20, stores_per_account=10)
+        sorted_stores = sorted(all_stores, key=int)
     else:
         try:
             load_config_and_stores()
@@ -479,12 +1091,28 @@ def build_gui() -> None:
                 master=root,
                 value=1 if acct["Status"] == "OK" else 0
             )
-        for sid in sorted(all_stores, key=int):
+        # sort once — the store grid below chunks the same list
+        sorted_stores = sorted(all_stores, key=int)
+        for sid in sorted_stores:
             store_vars[sid] = tk.IntVar(master=root, value=1)
     # ────────────────────────────────────────────────────────────────
 
     root.grid_columnconfigure(0, weight=1)
 
+    # per-account store lists, filtered against store_vars once — the
+    # cascade handlers below used to redo this filter on every click
+    acct_stores = {
+        name: tuple(s for s in sids if s in store_vars)
+        for name, sids in account_store_map.items()
+    }
+
+    # one shared cascade handler for every account checkbox — bound per
+    # account with functools.partial instead of a fresh closure each
+    def toggle_account(name: str, var: tk.IntVar) -> None:
+        val = var.get()
+        for s in acct_stores.get(name, ()):
+            store_vars[s].set(val)
+
     # --- ACCOUNTS header row ---
     def acct_select_all():
         for v in account_vars.values():
@@ -513,14 +1141,17 @@ def build_gui() -> None:
     ACC_COLS = 10
     acct_frame = ScrollableFrame(root, height=75)
     acct_frame.grid(row=1, column=0, sticky="ew", padx=12)
-    for c in range(ACC_COLS):
-        acct_frame.inner.grid_columnconfigure(c, weight=1)
 
-    rows = [
+    acct_rows = [
         config_accounts[i:i+ACC_COLS]
         for i in range(0, len(config_accounts), ACC_COLS)
     ]
-    for r, row_items in enumerate(rows):
+
+    def make_acct_row(parent, r):
+        row_items = acct_rows[r]
+        frame = tk.Frame(parent)
+        for c in range(ACC_COLS):
+            frame.grid_columnconfigure(c, weight=1)
         offset = (ACC_COLS - len(row_items)) // 2
         for c, acct in enumerate(row_items):
             real_name = acct["Name"]
@@ -528,19 +1159,18 @@ def build_gui() -> None:
             var       = account_vars[real_name]
 
             cb = tk.Checkbutton(
-                acct_frame.inner,
+                frame,
                 text=login_lbl,
                 variable=var,
                 fg="black" if acct["Status"]=="OK" else "red",
                 state=(tk.NORMAL if acct["Status"]=="OK" else tk.DISABLED),
-                command=lambda n=real_name, v=var: [
-                    store_vars[s].set(v.get())
-                    for s in account_store_map.get(n, [])
-                    if s in store_vars
-                ]
+                command=functools.partial(toggle_account, real_name, var)
             )
-            cb.grid(row=r, column=c + offset, padx=6, pady=4, sticky="n")
+            cb.grid(row=0, column=c + offset, padx=6, pady=4, sticky="n")
             ToolTip(cb, real_name)
+        return frame
+
+    acct_frame.populate(len(acct_rows), make_acct_row, row_height=30)
 
     # --- STORES header ---
     def store_select_all():
@@ -565,19 +1195,24 @@ def build_gui() -> None:
     STORE_COLS = 10
     store_frame = ScrollableFrame(root, height=120)
     store_frame.grid(row=3, column=0, sticky="ew", padx=12)
-    for c in range(STORE_COLS):
-        store_frame.inner.grid_columnconfigure(c, weight=1)
 
-    rows = [
-        sorted(all_stores, key=int)[i:i+STORE_COLS]
-        for i in range(0, len(all_stores), STORE_COLS)
+    store_rows = [
+        sorted_stores[i:i+STORE_COLS]
+        for i in range(0, len(sorted_stores), STORE_COLS)
     ]
-    for r, row_items in enumerate(rows):
+
+    def make_store_row(parent, r):
+        row_items = store_rows[r]
+        frame = tk.Frame(parent)
+        for c in range(STORE_COLS):
+            frame.grid_columnconfigure(c, weight=1)
         offset = (STORE_COLS - len(row_items)) // 2
         for c, sid in enumerate(row_items):
-            var = store_vars[sid]
-            cb = tk.Checkbutton(store_frame.inner, text=sid, variable=var)
-            cb.grid(row=r, column=c + offset, padx=6, pady=3, sticky="n")
+            cb = tk.Checkbutton(frame, text=sid, variable=store_vars[sid])
+            cb.grid(row=0, column=c + offset, padx=6, pady=3, sticky="n")
+        return frame
+
+    store_frame.populate(len(store_rows), make_store_row, row_height=28)
 
     # --- DATE range ---
     date_frame = tk.Frame(root)
@@ -594,8 +1229,7 @@ def build_gui() -> None:
     range_var = tk.StringVar(value="Today")
     start_entry.bind("<KeyRelease>", lambda e: range_var.set("Custom"))
     end_entry  .bind("<KeyRelease>", lambda e: range_var.set("Custom"))
-    opts = ["Custom","Today","Yesterday","Past 2 Days","Past 3 Days",
-            "Past 7 Days","Past 14 Days","Past 30 Days"]
+    opts = ["Custom"] + list(DATE_RANGES.keys())
     opts_frame = tk.Frame(root)
     opts_frame.grid(row=5, column=0, pady=(0,10))
     for idx, val in enumerate(opts):
@@ -620,6 +1254,10 @@ def build_gui() -> None:
     ).pack(side="left", padx=10)
 
     load_external_modules(root)
+
+    # one layout pass for the finished tree, then show the window
+    root.update_idletasks()
+    root.deiconify()
     root.mainloop()
 
 # ── entry-point ────────────────────────────────────────────────────────────
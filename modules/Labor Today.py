@@ -1,7 +1,7 @@
 import tkinter as tk
 from tkinter.scrolledtext import ScrolledText
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import as_completed
 
 # ---------------------------------------------------------------------------
 # Module: daily_clockins.py
@@ -28,7 +28,7 @@ def run(window):
 
     # ---- pull globals from host ------------------------------------------
     try:
-        from __main__ import fetch_data, store_vars, config_accounts  # type: ignore
+        from __main__ import EXECUTOR, fetch_data, store_vars, config_accounts  # type: ignore
     except ImportError:
         log("❌ Required symbols (fetch_data / store_vars / config_accounts) missing.")
         return
@@ -43,33 +43,41 @@ def run(window):
     log(f"Stores: {', '.join(selected)}")
     log("Fetching Daily Timeclock …\n")
 
-    # ---- concurrent API calls -------------------------------------------
-    futures = {}
-    with ThreadPoolExecutor(max_workers=10) as ex:
-        for acct in config_accounts:
-            cid, ckey, acct_name = acct["ClientID"], acct["ClientKEY"], acct["Name"]
-            for store_id in acct.get("StoreIDs", []):
-                if store_id in selected:
-                    fut = ex.submit(
-                        fetch_data,
-                        ENDPOINT_NAME,
-                        store_id,
-                        today,
-                        today,
-                        cid,
-                        ckey,
-                    )
-                    futures[fut] = (acct_name, store_id)
+    # ---- concurrent API calls (shared host pool) --------------------------
+    # exactly one call per selected store, even if accounts overlap
+    dispatch = {}
+    for acct in config_accounts:
+        cid, ckey, acct_name = acct["ClientID"], acct["ClientKEY"], acct["Name"]
+        for store_id in acct.get("StoreIDs", []):
+            if store_id in selected:
+                dispatch.setdefault(store_id, (cid, ckey, acct_name))
+
+    futs = []
+    for store_id, (cid, ckey, acct_name) in dispatch.items():
+        fut = EXECUTOR.submit(
+            fetch_data,
+            ENDPOINT_NAME,
+            store_id,
+            today,
+            today,
+            cid,
+            ckey,
+        )
+        # tag the future itself — no correlation dict to maintain
+        fut.store_meta = (acct_name, store_id)
+        futs.append(fut)
 
     # ---- collate results -------------------------------------------------
-    for fut in as_completed(futures):
-        acct_name, store_id = futures[fut]
+    for fut in as_completed(futs):
+        acct_name, store_id = fut.store_meta
         result = fut.result()
-        if "error" in result:
-            log(f"Store {store_id}  (Acct: {acct_name})  →  ERROR: {result['error']}")
+        if not result.ok:
+            log(f"Store {store_id}  (Acct: {acct_name})  →  ERROR: {result.data}")
             continue
 
-        data = result.get("data", result)
+        data = result.data
+        if isinstance(data, dict):
+            data = data.get("data", data)
         if isinstance(data, dict):
             data = [data]
 
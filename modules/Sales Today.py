@@ -1,7 +1,7 @@
 import tkinter as tk
 from tkinter.scrolledtext import ScrolledText
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, wait
 
 # ---------------------------------------------------------------------------
 # Module: daily_sales.py
@@ -11,6 +11,29 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 
 ENDPOINT_NAME = "Sales Summary"  # key in the host ENDPOINTS dict
 
+# net-sales field names observed across LiveIQ responses, most common first
+NET_SALES_KEYS = ("netSales", "netSale", "netSalesTotal", "netSalesAmount")
+
+_EMPTY = {}  # shared read-only fallback for malformed payloads
+
+
+def extract_net_sales(data):
+    """Pull the net-sales figure out of one store's payload.
+
+    Deliberately a self-contained pure function over plain dicts/lists:
+    it is the CPU-bound core of this module, and the piece a compiled
+    extension would wrap if these drop-ins ever grew a build step.
+    """
+    if type(data) is dict:
+        data = data.get("data", data)
+    # expecting a one-element list for the day; fallback to dict —
+    # identity type checks skip isinstance's subclass traversal
+    t = type(data)
+    summary = (data[0] if t is list and data
+               else data if t is dict
+               else _EMPTY)
+    return next((summary[k] for k in NET_SALES_KEYS if k in summary), "N/A")
+
 
 def run(window):
     """Populate GUI elements inside the *window* passed by the host."""
@@ -29,9 +52,12 @@ def run(window):
 
     # ---- pull host globals -----------------------------------------------
     try:
-        from __main__ import fetch_data, store_vars, config_accounts  # type: ignore
+        from __main__ import (  # type: ignore
+            BATCH_LIMIT, EXECUTOR, build_url, fetch_url, split_batch,
+            store_vars, config_accounts,
+        )
     except ImportError:
-        log("❌ Could not locate required symbols (fetch_data / store_vars / config_accounts).")
+        log("❌ Could not locate required symbols (fetch_url / store_vars / config_accounts).")
         return
 
     selected = [sid for sid, var in store_vars.items() if var.get()]
@@ -44,55 +70,92 @@ def run(window):
     log(f"Stores: {', '.join(selected)}")
     log("Fetching Sales Summary …\n")
 
-    # ---- parallel API calls ----------------------------------------------
-    futures = {}
-    with ThreadPoolExecutor(max_workers=10) as ex:
-        for acct in config_accounts:
-            cid, ckey = acct["ClientID"], acct["ClientKEY"]
-            for store_id in acct.get("StoreIDs", []):
-                if store_id in selected:
-                    fut = ex.submit(
-                        fetch_data,
-                        ENDPOINT_NAME,
-                        store_id,
-                        today,
-                        today,
-                        cid,
-                        ckey,
-                    )
-                    futures[fut] = store_id
-
-    # ---- collect & show ---------------------------------------------------
+    # ---- parallel API calls (shared host pool, bounded window) ------------
     sales_map = {}  # {store : netSales}
 
-    for fut in as_completed(futures):
-        store_id = futures[fut]
-        result = fut.result()
-        if "error" in result:
-            sales_map[store_id] = f"ERROR: {result['error']}"
-            continue
-
-        data = result.get("data", result)
-        # Expecting a list with one element for the day; fallback to dict
-        if isinstance(data, list) and data:
-            summary = data[0]
-        elif isinstance(data, dict):
-            summary = data
-        else:
-            summary = {}
-
-        # Common keys observed: netSales, netSale, netSalesTotal
-        for key in ("netSales", "netSale", "netSalesTotal", "netSalesAmount"):
-            if key in summary:
-                sales_map[store_id] = summary[key]
-                break
-        else:
-            sales_map[store_id] = "N/A"
-
-    # Pretty‑print sorted by store number
-    log("=== Daily Net Sales ===")
-    for sid in sorted(sales_map, key=int):
-        val = sales_map[sid]
+    def refetch_single(ids):
+        # per-store fallback, mirroring the viewer: used when a batch is
+        # rejected or its rows cannot be attributed to stores
+        for store_id in ids:
+            cid, ckey = dispatch[store_id]
+            single = fetch_url(
+                build_url(ENDPOINT_NAME, store_id, today, today),
+                cid, ckey)
+            sales_map[store_id] = (
+                extract_net_sales(single.data) if single.ok
+                else f"ERROR: {single.data}")
+
+    def harvest(done):
+        for fut in done:
+            ids = fut.store_ids
+            result = fut.result()
+            if not result.ok:
+                if len(ids) > 1:
+                    refetch_single(ids)
+                else:
+                    sales_map[ids[0]] = f"ERROR: {result.data}"
+                continue
+
+            if len(ids) == 1:
+                parts = {ids[0]: result.data}
+            else:
+                parts = split_batch(result.data, ids)
+
+            for store_id, data in parts.items():
+                if store_id not in dispatch:
+                    # split_batch handed back one combined block — rows
+                    # lacked restaurantNumber, so refetch per store
+                    refetch_single(ids)
+                    break
+                sales_map[store_id] = extract_net_sales(data)
+
+    # keep at most WINDOW futures alive: completed results are drained and
+    # released mid-submission instead of piling up behind as_completed
+    WINDOW = 20
+
+    # exactly one call per selected store, even if accounts overlap
+    dispatch = {}
+    for acct in config_accounts:
+        cid, ckey = acct["ClientID"], acct["ClientKEY"]
+        for store_id in acct.get("StoreIDs", []):
+            if store_id in selected:
+                dispatch.setdefault(store_id, (cid, ckey))
+
+    # one batched call per account chunk — Sales Summary accepts a
+    # comma-separated {restaurantNumbers} list, mirroring the viewer
+    groups = {}
+    for store_id, creds in dispatch.items():
+        groups.setdefault(creds, []).append(store_id)
+
+    pending = set()
+    for (cid, ckey), ids in groups.items():
+        for i in range(0, len(ids), BATCH_LIMIT):
+            batch = ids[i:i + BATCH_LIMIT]
+            url = build_url(ENDPOINT_NAME, ",".join(batch), today, today)
+            fut = EXECUTOR.submit(fetch_url, url, cid, ckey)
+            # tag the future itself — no correlation dict to maintain
+            fut.store_ids = batch
+            pending.add(fut)
+            if len(pending) >= WINDOW:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                harvest(done)
+
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        harvest(done)
+
+    # Pretty‑print sorted by store number; each id is parsed once and a
+    # non‑numeric id sorts after the numeric block instead of crashing
+    def _store_key(kv):
+        try:
+            return (0, int(kv[0]))
+        except ValueError:
+            return (1, kv[0])
+
+    lines = ["=== Daily Net Sales ==="]
+    for sid, val in sorted(sales_map.items(), key=_store_key):
         if isinstance(val, (int, float)):
             val = f"${val:,.2f}"
-        log(f"Store {sid:>6} : {val}")
+        lines.append(f"Store {sid:>6} : {val}")
+    # one insert → one widget redraw, instead of a reflow per store line
+    log("\n".join(lines))